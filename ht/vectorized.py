@@ -49,6 +49,11 @@ The correct syntax is as follows:
 
 >>> import ht.vectorized # Necessary
 >>> from ht.vectorized import * # May be used without first importing ht
+
+A few of the tube bank correlations, which are commonly evaluated at many
+operating points at once, are implemented natively with numpy instead of
+being wrapped; they accept and broadcast arrays for all of their numeric 
+arguments and give the same results as the scalar functions.
 '''
 
 __all__ = []
@@ -67,5 +72,302 @@ for name in dir(ht):
 globals().update(__funcs)
 
 
+from math import pi
+from ht.conv_tube_bank import (Zukauskas_Czs, ESDU_73031_F2,
+                               Zukauskas_Re_breaks_inline, Zukauskas_cm_inline,
+                               Zukauskas_Re_breaks_staggered, Zukauskas_cm_staggered,
+                               ESDU_73031_Re_breaks, ESDU_73031_am_inline,
+                               ESDU_73031_am_staggered,
+                               Grimson_Nl_aligned, Grimson_Nl_staggered,
+                               Grimison_aligned_low, Grimison_aligned_high,
+                               Grimison_C1_aligned_coeffs, Grimison_m_aligned_coeffs,
+                               Grimson_staggered_xs, Grimson_staggered_ys,
+                               Grimson_C1_staggered_grid, Grimson_m_staggered_grid,
+                               Kern_f_Re_breaks, Kern_f_Re_coeffs,
+                               dP_f_pitch_low, dP_f_pitch_high,
+                               dP_staggered_f_breaks, dP_staggered_f_coeffs,
+                               dP_inline_f_breaks, dP_inline_f_coeffs,
+                               dP_staggered_correction_breaks, dP_staggered_correction_coeffs,
+                               dP_staggered_correction_Re_low, dP_staggered_correction_Re_high,
+                               dP_inline_correction_breaks, dP_inline_correction_coeffs,
+                               dP_inline_correction_Re_low, dP_inline_correction_Re_high,
+                               Bell_baffle_configuration_breaks, Bell_baffle_configuration_pieces,
+                               Bell_baffle_configuration_coeffs,
+                               Bell_baffle_leakage_x_max, Bell_baffle_leakage_breaks,
+                               Bell_baffle_leakage_z_knots, Bell_baffle_leakage_pieces,
+                               Bell_bundle_bypass_x_breaks, Bell_bundle_bypass_z_breaks,
+                               Bell_bundle_bypass_high_pieces, Bell_bundle_bypass_low_pieces)
+
+# Row correction tables, with the factor of 1 for long tube banks appended
+_Zukauskas_Czs = np.array(Zukauskas_Czs)
+_Zukauskas_cm_inline = np.array(Zukauskas_cm_inline)
+_Zukauskas_cm_staggered = np.array(Zukauskas_cm_staggered)
+_ESDU_73031_am_inline = np.array(ESDU_73031_am_inline)
+_ESDU_73031_am_staggered = np.array(ESDU_73031_am_staggered)
+_ESDU_73031_F2 = np.array(ESDU_73031_F2)
+_Grimson_Nl_aligned = np.array(Grimson_Nl_aligned)
+_Grimson_Nl_staggered = np.array(Grimson_Nl_staggered)
+_Grimison_C1_aligned_coeffs = np.array(Grimison_C1_aligned_coeffs).reshape(4, 4)
+_Grimison_m_aligned_coeffs = np.array(Grimison_m_aligned_coeffs).reshape(4, 4)
+_Grimson_staggered_xs = np.array(Grimson_staggered_xs)
+_Grimson_staggered_ys = np.array(Grimson_staggered_ys)
+_Grimson_C1_staggered_grid = np.array(Grimson_C1_staggered_grid).reshape(len(Grimson_staggered_xs), -1)
+_Grimson_m_staggered_grid = np.array(Grimson_m_staggered_grid).reshape(len(Grimson_staggered_xs), -1)
+_Kern_f_Re_breaks = np.array(Kern_f_Re_breaks)
+_Kern_f_Re_coeffs = np.array(Kern_f_Re_coeffs)
+_Bell_baffle_configuration_breaks = np.array(Bell_baffle_configuration_breaks)
+_Bell_baffle_configuration_pieces = np.array(Bell_baffle_configuration_pieces)
+_Bell_baffle_leakage_breaks = np.array(Bell_baffle_leakage_breaks)
+_Bell_baffle_leakage_z_knots = np.array(Bell_baffle_leakage_z_knots)
+_Bell_baffle_leakage_pieces = np.array(Bell_baffle_leakage_pieces).reshape(len(Bell_baffle_leakage_breaks) - 1,
+                                                                           len(Bell_baffle_leakage_z_knots), 4)
+_Bell_bundle_bypass_x_breaks = np.array(Bell_bundle_bypass_x_breaks)
+_Bell_bundle_bypass_z_breaks = np.array(Bell_bundle_bypass_z_breaks)
+_Bell_bundle_bypass_high_pieces = np.array(Bell_bundle_bypass_high_pieces).reshape(len(Bell_bundle_bypass_x_breaks) - 1,
+                                                                                   len(Bell_bundle_bypass_z_breaks) - 1, 4, 4)
+_Bell_bundle_bypass_low_pieces = np.array(Bell_bundle_bypass_low_pieces).reshape(len(Bell_bundle_bypass_x_breaks) - 1,
+                                                                                 len(Bell_bundle_bypass_z_breaks) - 1, 4, 4)
+_dP_staggered_f_breaks = np.array(dP_staggered_f_breaks)
+_dP_staggered_f_coeffs = np.array(dP_staggered_f_coeffs).reshape(-1, 4, 4)
+_dP_inline_f_breaks = np.array(dP_inline_f_breaks)
+_dP_inline_f_coeffs = np.array(dP_inline_f_coeffs).reshape(-1, 4, 4)
+_dP_staggered_correction_breaks = np.array(dP_staggered_correction_breaks)
+_dP_staggered_correction_coeffs = np.array(dP_staggered_correction_coeffs)
+_dP_inline_correction_breaks = np.array(dP_inline_correction_breaks)
+_dP_inline_correction_coeffs = np.array(dP_inline_correction_coeffs)
+
+
+def _tube_bank_staggered(pitch_parallel, pitch_normal):
+    ratio = np.asarray(pitch_normal, dtype=float)/np.asarray(pitch_parallel, dtype=float)
+    return np.abs(1.0 - ratio) > 0.05, ratio
+
+
+def Zukauskas_tube_row_correction(tube_rows, staggered=True, Re=1E4):
+    rows = np.trunc(np.asarray(tube_rows, dtype=float)).astype(int)
+    idx = np.clip(rows, 1, 20) - 1
+    row = np.where(staggered, np.where(np.asarray(Re) < 1000, 1, 2), 0)
+    return _Zukauskas_Czs[row, idx]
+
+
+def Nu_Zukauskas_Bejan(Re, Pr, tube_rows, pitch_parallel, pitch_normal,
+                       Pr_wall=None):
+    Re = np.asarray(Re, dtype=float)
+    Pr = np.asarray(Pr, dtype=float)
+    staggered, ratio = _tube_bank_staggered(pitch_parallel, pitch_normal)
+    i_staggered = np.searchsorted(Zukauskas_Re_breaks_staggered, Re, side='right')
+    i_inline = np.searchsorted(Zukauskas_Re_breaks_inline, Re, side='right')
+    c = np.where(staggered, _Zukauskas_cm_staggered[i_staggered, 0], _Zukauskas_cm_inline[i_inline, 0])
+    m = np.where(staggered, _Zukauskas_cm_staggered[i_staggered, 1], _Zukauskas_cm_inline[i_inline, 1])
+    f = np.where(staggered & (i_staggered >= 2), ratio**0.2, 1.0)
+    Nu = c*Re**m*Pr**0.36*f
+    if Pr_wall is not None:
+        Nu = Nu*(Pr/Pr_wall)**0.25
+    return Nu*Zukauskas_tube_row_correction(tube_rows, staggered, Re)
+
+
+def ESDU_tube_row_correction(tube_rows, staggered=True, Re=3000.0, method='Hewitt'):
+    if method == 'Hewitt':
+        idx = np.clip(np.asarray(tube_rows).astype(int), 3, 10) - 3
+        return _ESDU_73031_F2[np.where(staggered, 1, 0), idx]
+
+
+def ESDU_tube_angle_correction(angle):
+    return np.sin(np.radians(angle))**0.6
+
+
+def Nu_ESDU_73031(Re, Pr, tube_rows, pitch_parallel, pitch_normal, 
+                  Pr_wall=None, angle=90.0):
+    Re = np.asarray(Re, dtype=float)
+    Pr = np.asarray(Pr, dtype=float)
+    staggered = _tube_bank_staggered(pitch_parallel, pitch_normal)[0]
+    i = np.searchsorted(ESDU_73031_Re_breaks, Re, side='left')
+    a = np.where(staggered, _ESDU_73031_am_staggered[i, 0], _ESDU_73031_am_inline[i, 0])
+    m = np.where(staggered, _ESDU_73031_am_staggered[i, 1], _ESDU_73031_am_inline[i, 1])
+    F2 = ESDU_tube_row_correction(tube_rows, staggered)
+    F3 = ESDU_tube_angle_correction(angle)
+    Nu = a*Re**m*Pr**0.34*F2*F3
+    if Pr_wall is not None:
+        # Same exponent for heating and cooling
+        Nu = Nu*(Pr/Pr_wall)**0.26
+    return Nu
+
+
+def Nu_HEDH_tube_bank(Re, Pr, Do, tube_rows, pitch_parallel, pitch_normal):
+    Re = np.asarray(Re, dtype=float)
+    Pr = np.asarray(Pr, dtype=float)
+    tube_rows = np.asarray(tube_rows, dtype=float)
+    staggered = _tube_bank_staggered(pitch_parallel, pitch_normal)[0]
+    a = np.asarray(pitch_normal, dtype=float)/Do
+    b = np.asarray(pitch_parallel, dtype=float)/Do
+    voidage = np.where(b >= 1, 1. - pi/(4.0*a), 1. - pi/(4.0*a*b))
+    Re = Re/voidage
+    Nu_laminar = 0.664*np.sqrt(Re)*Pr**(1.0/3.)
+    Nu_turbulent = 0.037*Re**0.8*Pr/(1. + 2.443*Re**-0.1*(Pr**(2/3.) - 1.0))
+    Nu = 0.3 + np.sqrt(Nu_laminar*Nu_laminar + Nu_turbulent*Nu_turbulent)
+    ba = b/a
+    fA = np.where(staggered, 1.0 + 2./(3.0*b),
+                  1.0 + 0.7/voidage**1.5*(ba - 0.3)/(ba + 0.7)**2)
+    fn = np.where(tube_rows < 10, (1.0 + (tube_rows - 1.0)*fA)/tube_rows, fA)
+    return Nu*fn
+
+
+def _bicubic_patch(x, y, P):
+    r0, r1, r2, r3 = [P[..., i, 0] + y*(P[..., i, 1] + y*(P[..., i, 2] + y*P[..., i, 3])) for i in range(4)]
+    return r0 + x*(r1 + x*(r2 + x*r3))
+
+
+def _grid_cell(x, xs):
+    x = np.clip(x, xs[0], xs[-1])
+    i = np.clip(np.searchsorted(xs, x, side='right') - 1, 0, len(xs) - 2)
+    return i, (x - xs[i])/(xs[i+1] - xs[i])
+
+
+def Nu_Grimison_tube_bank(Re, Pr, Do, tube_rows, pitch_parallel, pitch_normal):
+    Re = np.asarray(Re, dtype=float)
+    Pr = np.asarray(Pr, dtype=float)
+    staggered = _tube_bank_staggered(pitch_parallel, pitch_normal)[0]
+    a = np.asarray(pitch_normal, dtype=float)/Do
+    b = np.asarray(pitch_parallel, dtype=float)/Do
+
+    x = np.clip(b, Grimison_aligned_low, Grimison_aligned_high) - Grimison_aligned_low
+    y = np.clip(a, Grimison_aligned_low, Grimison_aligned_high) - Grimison_aligned_low
+    C1_aligned = _bicubic_patch(x, y, _Grimison_C1_aligned_coeffs)
+    m_aligned = _bicubic_patch(x, y, _Grimison_m_aligned_coeffs)
+
+    i, u = _grid_cell(b, _Grimson_staggered_xs)
+    j, v = _grid_cell(a, _Grimson_staggered_ys)
+    w00, w01, w10, w11 = (1.0 - u)*(1.0 - v), (1.0 - u)*v, u*(1.0 - v), u*v
+    c, d = _Grimson_C1_staggered_grid, _Grimson_m_staggered_grid
+    C1_staggered = w00*c[i, j] + w01*c[i, j+1] + w10*c[i+1, j] + w11*c[i+1, j+1]
+    m_staggered = w00*d[i, j] + w01*d[i, j+1] + w10*d[i+1, j] + w11*d[i+1, j+1]
+
+    C1 = np.where(staggered, C1_staggered, C1_aligned)
+    m = np.where(staggered, m_staggered, m_aligned)
+
+    rows = np.trunc(np.asarray(tube_rows, dtype=float)).astype(int)
+    short = rows < 10
+    idx = np.where(short, np.maximum(rows, 1), 0)
+    C2 = np.where(short, np.where(staggered, _Grimson_Nl_staggered[idx],
+                                  _Grimson_Nl_aligned[idx]), 1.0)
+    return 1.13*Re**m*Pr**(1.0/3.0)*C2*C1
+
+
+def _piecewise_bicubic(x, y, breaks, y0, y1, coeffs):
+    i, _ = _grid_cell(x, breaks)
+    x = np.clip(x, breaks[0], breaks[-1]) - breaks[i]
+    y = np.clip(y, y0, y1) - y0
+    return _bicubic_patch(x, y, coeffs[i])
+
+
+def _piecewise_linear_cubic(x, y, breaks, y0, y1, coeffs):
+    i, u = _grid_cell(x, breaks)
+    y = (np.clip(y, y0, y1) - y0)/(y1 - y0)
+    c, d = coeffs[i], coeffs[i+1]
+    a = c[..., 3] + y*(c[..., 2] + y*(c[..., 1] + y*c[..., 0]))
+    b = d[..., 3] + y*(d[..., 2] + y*(d[..., 1] + y*d[..., 0]))
+    return a + u*(b - a)
+
+
+def dP_Zukauskas(Re, n, ST, SL, D, rho, Vmax):
+    Re = np.asarray(Re, dtype=float)
+    a = np.asarray(ST, dtype=float)/D
+    b = np.asarray(SL, dtype=float)/D
+    inline = a == b
+    f = np.where(inline,
+                 _piecewise_bicubic(Re, b, _dP_inline_f_breaks, dP_f_pitch_low,
+                                    dP_f_pitch_high, _dP_inline_f_coeffs),
+                 _piecewise_bicubic(Re, a, _dP_staggered_f_breaks, dP_f_pitch_low,
+                                    dP_f_pitch_high, _dP_staggered_f_coeffs))
+    x = np.where(inline,
+                 _piecewise_linear_cubic((a-1.)/(b-1.), Re, _dP_inline_correction_breaks,
+                                         dP_inline_correction_Re_low, dP_inline_correction_Re_high,
+                                         _dP_inline_correction_coeffs),
+                 _piecewise_linear_cubic(a/b, Re, _dP_staggered_correction_breaks,
+                                         dP_staggered_correction_Re_low, dP_staggered_correction_Re_high,
+                                         _dP_staggered_correction_coeffs))
+    return n*x*f*rho/2*Vmax**2
+
+
+def _piecewise_cubic(x, breaks, coeffs):
+    i = np.clip(np.searchsorted(breaks, x, side='right') - 1, 0, len(breaks) - 2)
+    c = coeffs[i]
+    x = x - breaks[i]
+    return c[..., 3] + x*(c[..., 2] + x*(c[..., 1] + x*c[..., 0]))
+
+
+def dP_Kern(m, rho, mu, DShell, LSpacing, pitch, Do, NBaffles, mu_w=None):
+    m, rho, mu, DShell, LSpacing, pitch, Do, NBaffles = [np.asarray(v, dtype=float) for v in
+                                                         (m, rho, mu, DShell, LSpacing, pitch, Do, NBaffles)]
+    Ss = DShell*(pitch-Do)*LSpacing/pitch
+    De = 4.0*pitch*pitch/(pi*Do) - Do # 4*(pitch^2 - pi*Do^2/4)/(pi*Do)
+    Gs = m/Ss
+    Re = De*Gs/mu
+    f = _piecewise_cubic(Re, _Kern_f_Re_breaks, _Kern_f_Re_coeffs)
+    den = 2.0*rho*De
+    if mu_w is not None:
+        # No correction where the wall viscosity is zero, as in the scalar function
+        mu_w = np.asarray(mu_w, dtype=float)
+        wall = mu_w != 0
+        den = den*(mu/np.where(wall, mu_w, mu))**0.14
+    return f*Gs*Gs*DShell*(NBaffles+1)/den
+
+
+def baffle_correction_Bell(crossflow_tube_fraction, method='spline'):
+    x = np.asarray(crossflow_tube_fraction, dtype=float)
+    if method == 'spline':
+        return _piecewise_cubic(x, _Bell_baffle_configuration_breaks, _Bell_baffle_configuration_pieces)
+    elif method == 'chebyshev':
+        x = 2.0*x - 1.0
+        tot = np.zeros_like(x)
+        for c in Bell_baffle_configuration_coeffs:
+            tot = tot*x + c
+        return tot
+    elif method == 'HEDH':
+        return 0.55 + 0.72*x
+    else:
+        raise ValueError("Correlation name not recognized; the available "
+                         "methods are 'spline', 'chebyshev' and 'HEDH'.")
+
+
+def baffle_leakage_Bell(Ssb, Stb, Sm, method='spline'):
+    Ssb = np.asarray(Ssb, dtype=float)
+    Stb = np.asarray(Stb, dtype=float)
+    S = Ssb + Stb
+    x = np.minimum(S/np.asarray(Sm, dtype=float), Bell_baffle_leakage_x_max)
+    z = Ssb/S
+    if np.any((z > 1.0) | (z < 0.0)):
+        raise ValueError('Ssb/(Ssb + Stb) must be between 0 and 1')
+    if method == 'spline':
+        i, _ = _grid_cell(x, _Bell_baffle_leakage_breaks)
+        j, v = _grid_cell(z, _Bell_baffle_leakage_z_knots)
+        x = np.clip(x, _Bell_baffle_leakage_breaks[0], _Bell_baffle_leakage_breaks[-1]) - _Bell_baffle_leakage_breaks[i]
+        c, d = _Bell_baffle_leakage_pieces[i, j], _Bell_baffle_leakage_pieces[i, j+1]
+        a = c[..., 3] + x*(c[..., 2] + x*(c[..., 1] + x*c[..., 0]))
+        b = d[..., 3] + x*(d[..., 2] + x*(d[..., 1] + x*d[..., 0]))
+        return np.minimum(a + v*(b - a), 1.0)
+    elif method == 'HEDH':
+        return 0.44*(1.0 - z) + (1.0 - 0.44*(1.0 - z))*np.exp(-2.2*x)
+    else:
+        raise ValueError("Correlation name not recognized; the available "
+                         "methods are 'spline' and 'HEDH'.")
+
 
-        
+def bundle_bypassing_Bell(bypass_area_fraction, seal_strips, crossflow_rows,
+                          laminar=False, method='spline'):
+    x = np.asarray(bypass_area_fraction, dtype=float)
+    z = np.asarray(seal_strips, dtype=float)/np.asarray(crossflow_rows, dtype=float)
+    if method == 'spline':
+        xs, zs = _Bell_bundle_bypass_x_breaks, _Bell_bundle_bypass_z_breaks
+        i, _ = _grid_cell(x, xs)
+        j, _ = _grid_cell(z, zs)
+        x = np.clip(x, xs[0], xs[-1]) - xs[i]
+        z = np.clip(z, zs[0], zs[-1]) - zs[j]
+        P = np.where(np.asarray(laminar)[..., None, None], _Bell_bundle_bypass_low_pieces[i, j],
+                     _Bell_bundle_bypass_high_pieces[i, j])
+        return np.minimum(_bicubic_patch(x, z, P), 1.0)
+    elif method == 'HEDH':
+        c = np.where(laminar, 1.35, 1.25)
+        return np.exp(-c*x*(1.0 - np.cbrt(2.0*z)))
+    else:
+        raise ValueError("Correlation name not recognized; the available "
+                         "methods are 'spline' and 'HEDH'.")
@@ -45,19 +45,26 @@ def mark_as_numba(func):
     
 @mark_as_numba
 def test_tube_bank():
-    # not implemented - dP_Zukauskas
-    
     kwargs = dict(Re=10263.37, Pr=.708, tube_rows=11, pitch_normal=.05, pitch_parallel=.05, Do=.025)
     assert_close(ht.numba.Nu_Grimison_tube_bank(**kwargs), ht.Nu_Grimison_tube_bank(**kwargs))
+    kwargs = dict(Re=10263.37, Pr=.708, tube_rows=7, pitch_normal=.07, pitch_parallel=.05, Do=.025)
+    assert_close(ht.numba.Nu_Grimison_tube_bank(**kwargs), ht.Nu_Grimison_tube_bank(**kwargs))
+    kwargs = dict(Re=10263.37, Pr=.708, tube_rows=3, pitch_normal=.2, pitch_parallel=.2, Do=.025)
+    assert_close(ht.numba.Nu_Grimison_tube_bank(**kwargs), ht.Nu_Grimison_tube_bank(**kwargs))
     
     assert_close(ht.numba.Zukauskas_tube_row_correction(4, staggered=True), 
                  ht.Zukauskas_tube_row_correction(4, staggered=True))
 
     kwargs = dict(Re=1E4, Pr=7., tube_rows=10, pitch_parallel=.05, pitch_normal=.05)
     assert_close(ht.numba.Nu_Zukauskas_Bejan(**kwargs), ht.Nu_Zukauskas_Bejan(**kwargs))
+    for Re in (50.0, 700.0, 1E4, 3E5):
+        kwargs = dict(Re=Re, Pr=7., tube_rows=5, pitch_parallel=.05, pitch_normal=.07)
+        assert_close(ht.numba.Nu_Zukauskas_Bejan(**kwargs), ht.Nu_Zukauskas_Bejan(**kwargs))
 
     kwargs = dict(Re=1.32E4, Pr=0.71, tube_rows=8, pitch_parallel=.09, pitch_normal=.05)
     assert_close(ht.numba.Nu_ESDU_73031(**kwargs), ht.Nu_ESDU_73031(**kwargs))
+    kwargs = dict(Re=200.0, Pr=0.71, tube_rows=2, pitch_parallel=.05, pitch_normal=.05, angle=60.0)
+    assert_close(ht.numba.Nu_ESDU_73031(**kwargs), ht.Nu_ESDU_73031(**kwargs))
 
     kwargs = dict(Re=10263.37, Pr=.708, tube_rows=11, pitch_normal=.05, pitch_parallel=.05, Do=.025)
     assert_close(ht.numba.Nu_HEDH_tube_bank(**kwargs), ht.Nu_HEDH_tube_bank(**kwargs))
@@ -66,9 +73,19 @@ def test_tube_bank():
 
     kwargs = dict(m=11., rho=995., mu=0.000803, mu_w=0.000657, DShell=0.584, LSpacing=0.1524, pitch=0.0254, Do=.019, NBaffles=22)
     assert_close(ht.numba.dP_Kern(**kwargs), ht.dP_Kern(**kwargs))
-
-    assert_close(ht.numba.baffle_correction_Bell(0.82, 'Chebyshev'), ht.numba.baffle_correction_Bell(0.82, 'Chebyshev'))
-    assert_close(ht.numba.baffle_correction_Bell(0.82), ht.numba.baffle_correction_Bell(0.82))
+    # Friction factor pieces across the whole range, and extrapolated
+    for m in (1E-4, 1E-3, 0.01, 0.1, 1.0, 11.0, 1E3, 3E3):
+        kwargs = dict(m=m, rho=995., mu=0.000803, DShell=0.584, LSpacing=0.1524, pitch=0.0254, Do=.019, NBaffles=22)
+        assert_close(ht.numba.dP_Kern(**kwargs), ht.dP_Kern(**kwargs))
+
+    for Re in (5.0, 1E3, 13943.0, 1E7):
+        for SL in (0.0313, 0.0343, 0.06):
+            kwargs = dict(Re=Re, n=7, ST=0.0313, SL=SL, D=0.0164, rho=1.217, Vmax=12.6)
+            assert_close(ht.numba.dP_Zukauskas(**kwargs), ht.dP_Zukauskas(**kwargs))
+
+    assert_close(ht.numba.baffle_correction_Bell(0.82, 'chebyshev'), ht.baffle_correction_Bell(0.82, 'chebyshev'))
+    for Fc in (0.1, 0.6, 0.82, 0.9, 0.95, 0.99, 1.0):
+        assert_close(ht.numba.baffle_correction_Bell(Fc), ht.baffle_correction_Bell(Fc))
 
     assert_close(ht.numba.baffle_leakage_Bell(1, 3, 8), ht.baffle_leakage_Bell(1, 3, 8))
     assert_close(ht.numba.baffle_leakage_Bell(1, 3, 8, 'HEDH'), ht.baffle_leakage_Bell(1, 3, 8, 'HEDH'))
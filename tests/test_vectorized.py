@@ -25,9 +25,128 @@ from numpy.testing import assert_allclose
 import ht
 import ht.vectorized
 import numpy as np
+import pytest
 
 
 def test_LMTD_vect():
     dTlms = [ht.LMTD(T, 60., 30., 40.2) for T in [100, 101]]
     dTlms_vect = ht.vectorized.LMTD([100, 101], 60., 30., 40.2)
     assert_allclose(dTlms, dTlms_vect)
+
+
+def test_tube_bank_Nu_vect():
+    Res = [5.0, 50.0, 100.0, 150.0, 300.0, 450.0, 500.0, 700.0, 1000.0, 1E4, 2E5, 3E5, 3E6]
+    pitches = [(.05, .05), (.05, .0502), (.05, .07), (.09, .05)]
+    for tube_rows in [-1, 0, 1, 2, 3, 5, 9, 10, 19, 20, 25]:
+        for pp, pn in pitches:
+            for Pr_wall in (None, 3.0):
+                expect = [ht.Nu_Zukauskas_Bejan(Re, 7., tube_rows, pp, pn, Pr_wall=Pr_wall) for Re in Res]
+                calc = ht.vectorized.Nu_Zukauskas_Bejan(Res, 7., tube_rows, pp, pn, Pr_wall=Pr_wall)
+                assert_allclose(calc, expect, rtol=1e-13)
+            
+                if tube_rows >= 0:
+                    expect = [ht.Nu_ESDU_73031(Re, .7, tube_rows, pp, pn, Pr_wall=Pr_wall, angle=75.0) for Re in Res]
+                    calc = ht.vectorized.Nu_ESDU_73031(Res, .7, tube_rows, pp, pn, Pr_wall=Pr_wall, angle=75.0)
+                    assert_allclose(calc, expect, rtol=1e-13)
+
+            if tube_rows > 0:
+                for Do in (.025, .03):
+                    expect = [ht.Nu_HEDH_tube_bank(Re, .7, Do, tube_rows, pp, pn) for Re in Res]
+                    calc = ht.vectorized.Nu_HEDH_tube_bank(Res, .7, Do, tube_rows, pp, pn)
+                    assert_allclose(calc, expect, rtol=1e-13)
+
+    # Geometry can vary point by point as well
+    pps, pns = [.05, .05, .09], [.05, .07, .05]
+    expect = [ht.Nu_Zukauskas_Bejan(1E4, 7., 5, pp, pn) for pp, pn in zip(pps, pns)]
+    assert_allclose(ht.vectorized.Nu_Zukauskas_Bejan(1E4, 7., 5, pps, pns), expect, rtol=1e-13)
+
+    # As can the tube row count
+    rows = [1, 2, 5, 9, 10, 11, 30]
+    expect = [ht.Nu_HEDH_tube_bank(1E4, 7., .03, n, .05, .07) for n in rows]
+    assert_allclose(ht.vectorized.Nu_HEDH_tube_bank(1E4, 7., .03, rows, .05, .07), expect, rtol=1e-13)
+    expect = [ht.Nu_Zukauskas_Bejan(1E4, 7., n, .05, .05) for n in rows]
+    assert_allclose(ht.vectorized.Nu_Zukauskas_Bejan(1E4, 7., rows, .05, .05), expect, rtol=1e-13)
+
+
+def test_Nu_Grimison_tube_bank_vect():
+    Res = [50.0, 1E3, 10263.37, 2E5]
+    ratios = [0.4, 1.0, 1.3, 1.5, 1.8667584356619125, 2.0, 2.5, 3.0, 4.5]
+    Do = .025
+    pns, pps = np.meshgrid([r*Do for r in ratios], [r*Do for r in ratios])
+    pns, pps = pns.ravel(), pps.ravel()
+    for tube_rows in [-1, 1, 3, 8, 10, 15]:
+        for Re in Res:
+            expect = [ht.Nu_Grimison_tube_bank(Re, .708, Do, tube_rows, pp, pn) for pp, pn in zip(pps, pns)]
+            calc = ht.vectorized.Nu_Grimison_tube_bank(Re, .708, Do, tube_rows, pps, pns)
+            assert_allclose(calc, expect, rtol=1e-13)
+
+    rows = [1, 2, 5, 8, 10, 30]
+    expect = [ht.Nu_Grimison_tube_bank(Res[2], .708, Do, n, .05, .07) for n in rows]
+    assert_allclose(ht.vectorized.Nu_Grimison_tube_bank(Res[2], .708, Do, rows, .05, .07), expect, rtol=1e-13)
+
+
+def test_dP_Zukauskas_vect():
+    Res = np.logspace(0, 7, 60).tolist() + [10.0, 100.0, 1E3, 1E5, 2756750.0]
+    D = 0.0164
+    # Inline, staggered, and pitches outside of the fits
+    for ST, SL in [(0.0313, 0.0313), (0.0313, 0.0343), (0.0343, 0.0313), (0.05, 0.05),
+                   (0.018, 0.018), (0.018, 0.06), (0.06, 0.018), (0.1, 0.02)]:
+        expect = [ht.dP_Zukauskas(Re, 7, ST, SL, D, 1.217, 12.6) for Re in Res]
+        calc = ht.vectorized.dP_Zukauskas(Res, 7, ST, SL, D, 1.217, 12.6)
+        assert_allclose(calc, expect, rtol=1e-13)
+
+    STs = [0.0313, 0.0313, 0.04]
+    SLs = [0.0313, 0.0343, 0.03]
+    expect = [ht.dP_Zukauskas(13943., n, ST, SL, D, 1.217, 12.6) for n, ST, SL in zip([7, 8, 9], STs, SLs)]
+    calc = ht.vectorized.dP_Zukauskas(13943., [7, 8, 9], STs, SLs, D, 1.217, 12.6)
+    assert_allclose(calc, expect, rtol=1e-13)
+
+
+def test_dP_Kern_vect():
+    # Covers every piece of the friction factor fit, and extrapolation past both ends
+    ms = np.logspace(-4, 3.5, 80)
+    kwargs = dict(rho=995., mu=0.000803, DShell=0.584, LSpacing=0.1524, pitch=0.0254, Do=.019, NBaffles=22)
+    for mu_w in [None, 0.0, 0.000657]:
+        expect = [ht.dP_Kern(m=m, mu_w=mu_w, **kwargs) for m in ms]
+        assert_allclose(ht.vectorized.dP_Kern(m=ms, mu_w=mu_w, **kwargs), expect, rtol=1e-13)
+
+    mu_ws = [0.000657, 0.0, 0.001]
+    pitches = [0.0254, 0.03, 0.0254]
+    expect = [ht.dP_Kern(11., 995., 0.000803, 0.584, 0.1524, pitch, .019, 22, mu_w=mu_w)
+              for pitch, mu_w in zip(pitches, mu_ws)]
+    calc = ht.vectorized.dP_Kern(11., 995., 0.000803, 0.584, 0.1524, pitches, .019, 22, mu_w=mu_ws)
+    assert_allclose(calc, expect, rtol=1e-13)
+
+
+def test_Bell_baffle_vect():
+    Fcs = np.linspace(-0.05, 1.05, 111)
+    for method in ['spline', 'chebyshev', 'HEDH']:
+        expect = [ht.baffle_correction_Bell(Fc, method) for Fc in Fcs]
+        assert_allclose(ht.vectorized.baffle_correction_Bell(Fcs, method), expect, rtol=1e-13, atol=1e-15)
+    with pytest.raises(ValueError):
+        ht.vectorized.baffle_correction_Bell(Fcs, 'foo')
+
+    Ssbs = [0.0, 0.1, 1.0, 1.0, 2.0, 3.0, 5.0]
+    Stbs = [1.0, 1.0, 1.0, 3.0, 2.0, 0.5, 0.0]
+    for Sm in [0.5, 4.0, 8.0, 40.0, 1E4]:
+        for method in ['spline', 'HEDH']:
+            expect = [ht.baffle_leakage_Bell(Ssb, Stb, Sm, method) for Ssb, Stb in zip(Ssbs, Stbs)]
+            calc = ht.vectorized.baffle_leakage_Bell(Ssbs, Stbs, Sm, method)
+            assert_allclose(calc, expect, rtol=1e-13)
+    with pytest.raises(ValueError):
+        ht.vectorized.baffle_leakage_Bell([1.0, -1.0], [1.0, 3.0], 8.0)
+    with pytest.raises(ValueError):
+        ht.vectorized.baffle_leakage_Bell(Ssbs, Stbs, 8.0, 'foo')
+
+    xs = np.linspace(-0.05, 0.9, 39)
+    for seal_strips in [0, 1, 2, 5, 12, 20]:
+        for laminar in [False, True]:
+            for method in ['spline', 'HEDH']:
+                expect = [ht.bundle_bypassing_Bell(x, seal_strips, 20, laminar, method) for x in xs]
+                calc = ht.vectorized.bundle_bypassing_Bell(xs, seal_strips, 20, laminar, method)
+                assert_allclose(calc, expect, rtol=1e-13)
+    laminar = [False, True, True]
+    expect = [ht.bundle_bypassing_Bell(0.3, 2, 10, lam) for lam in laminar]
+    assert_allclose(ht.vectorized.bundle_bypassing_Bell(0.3, 2, 10, laminar), expect, rtol=1e-13)
+    with pytest.raises(ValueError):
+        ht.vectorized.bundle_bypassing_Bell(xs, 2, 10, method='foo')